@@ -46,6 +46,9 @@ BRIEF_TRIGGER = "[GENERATE_BRIEF]"
 # Early generation trigger (user wants to generate with available info)
 GENERATE_NOW_TRIGGER = "[GENERATE_NOW]"
 
+# Words that force a safety check even on short follow-up messages
+URGENT_FOLLOWUP_WORDS = ("help", "emergency", "scared", "hurt", "kill", "die", "suicide")
+
 
 # ============================================
 # Graph Nodes
@@ -121,11 +124,10 @@ def route_after_initialize(state: ConversationalState) -> Literal["brief", "chec
 
     # Quick heuristic: check if query is short follow-up
     query = state.get("current_query", "")
-    if len(query) < 30 and not any(
-        word in query.lower()
-        for word in ["help", "emergency", "scared", "hurt", "kill", "die", "suicide"]
-    ):
-        return "skip"
+    if len(query) < 30:
+        query_lower = query.lower()
+        if not any(word in query_lower for word in URGENT_FOLLOWUP_WORDS):
+            return "skip"
 
     return "check"
 
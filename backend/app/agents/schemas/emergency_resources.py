@@ -1,5 +1,6 @@
 """Emergency and crisis resources for Australian legal matters."""
 
+from functools import lru_cache
 from typing import Literal
 
 # National resources available across all states
@@ -312,6 +313,31 @@ EMERGENCY_RESOURCES: dict[str, list[dict]] = {
 }
 
 
+@lru_cache(maxsize=128)
+def _resources_for_risk(risk_category: str, user_state: str | None) -> tuple[dict, ...]:
+    """Resolve and deduplicate resources once per (category, state) pair."""
+    resources = []
+
+    # Add national resources for this category
+    national = NATIONAL_RESOURCES.get(risk_category, [])
+    resources.extend(national)
+
+    # Add state-specific resources if state is known
+    if user_state and user_state in STATE_RESOURCES:
+        state_specific = STATE_RESOURCES[user_state].get(risk_category, [])
+        resources.extend(state_specific)
+
+    # Deduplicate by name while preserving order
+    seen_names = set()
+    unique_resources = []
+    for resource in resources:
+        if resource["name"] not in seen_names:
+            seen_names.add(resource["name"])
+            unique_resources.append(resource)
+
+    return tuple(unique_resources)
+
+
 def get_resources_for_risk(
     risk_category: Literal[
         "criminal",
@@ -325,6 +351,9 @@ def get_resources_for_risk(
     """
     Get relevant emergency resources for a risk category and optional state.
 
+    The lookup is cached per (category, state); each call gets its own list
+    so callers can't alter the cached result.
+
     Args:
         risk_category: The type of high-risk situation detected
         user_state: Australian state/territory code (e.g., "NSW", "VIC")
@@ -332,23 +361,4 @@ def get_resources_for_risk(
     Returns:
         List of resource dictionaries with name, phone, url, description
     """
-    resources = []
-
-    # Add national resources for this category
-    national = NATIONAL_RESOURCES.get(risk_category, [])
-    resources.extend(national)
-
-    # Add state-specific resources if state is known
-    if user_state and user_state in STATE_RESOURCES:
-        state_specific = STATE_RESOURCES[user_state].get(risk_category, [])
-        resources.extend(state_specific)
-
-    # Deduplicate by name while preserving order
-    seen_names = set()
-    unique_resources = []
-    for resource in resources:
-        if resource["name"] not in seen_names:
-            seen_names.add(resource["name"])
-            unique_resources.append(resource)
-
-    return unique_resources
+    return list(_resources_for_risk(risk_category, user_state))
@@ -8,7 +8,9 @@ User-triggered brief generation that:
 This is Phase 3 of conversational mode - activated when user clicks "Generate Brief".
 """
 
-import uuid
+import re
+import secrets
+from functools import lru_cache
 from typing import Literal, Optional
 from pydantic import BaseModel, Field
 from langchain_openai import ChatOpenAI
@@ -40,22 +42,25 @@ SKIP_PHRASES = [
     "not certain",
 ]
 
+GENERATE_NOW_PHRASES = ("generate brief now", "generate now", "just generate", "skip all")
+
+# Each phrase list compiled to one alternation so detection is a single scan
+_SKIP_PATTERN = re.compile("|".join(map(re.escape, SKIP_PHRASES)))
+_GENERATE_NOW_PATTERN = re.compile("|".join(map(re.escape, GENERATE_NOW_PHRASES)))
+
 
 def _detect_skip_response(message: str) -> bool:
     """Check if the user's message indicates they want to skip/don't know."""
     if not message:
         return False
-    message_lower = message.lower().strip()
-    return any(phrase in message_lower for phrase in SKIP_PHRASES)
+    return _SKIP_PATTERN.search(message.lower()) is not None
 
 
 def _detect_generate_now(message: str) -> bool:
     """Check if user wants to generate the brief immediately."""
     if not message:
         return False
-    message_lower = message.lower().strip()
-    generate_phrases = ["generate brief now", "generate now", "just generate", "skip all"]
-    return any(phrase in message_lower for phrase in generate_phrases)
+    return _GENERATE_NOW_PATTERN.search(message.lower()) is not None
 
 
 # ============================================
@@ -299,6 +304,25 @@ REQUIRED_INFO_BY_AREA = {
 }
 
 
+# Urgency indicator shown in the formatted brief
+URGENCY_EMOJI = {
+    "urgent": "🔴",
+    "standard": "🟡",
+    "low_priority": "🟢",
+}
+
+
+@lru_cache(maxsize=None)
+def _get_structured_llm(model: str, temperature: float, schema: type[BaseModel]):
+    """Get a shared structured-output LLM for a model/schema pair.
+
+    Built once per combination so the schema's tool definition isn't
+    regenerated on every call.
+    """
+    llm = ChatOpenAI(model=model, temperature=temperature)
+    return llm.with_structured_output(schema)
+
+
 # ============================================
 # Node Functions
 # ============================================
@@ -382,12 +406,38 @@ async def brief_check_info_node(
         }
 
     # No pending questions - need to analyze conversation to extract facts
-    # Count substantive messages (excluding brief trigger)
-    substantive_messages = [
-        m for m in messages
+    # Count substantive messages (excluding brief trigger) in a single pass
+    substantive_count = sum(
+        1 for m in messages
         if isinstance(m, HumanMessage) and "[GENERATE_BRIEF]" not in m.content
-    ]
-    is_empty_conversation = len(substantive_messages) < 2
+    )
+    is_empty_conversation = substantive_count < 2
+
+    # Brief triggered before the user described anything - there are no facts
+    # to extract, so skip the LLM call and start a full intake
+    if substantive_count == 0:
+        general_info = REQUIRED_INFO_BY_AREA["general"]
+        logger.info("Brief triggered with no conversation, starting full intake")
+        return {
+            "brief_facts_collected": {
+                "legal_area": "general",
+                "situation_summary": "User needs legal help",
+                "key_facts": [],
+                "parties_involved": [],
+                "timeline_events": [],
+                "documents_mentioned": [],
+                "user_goals": [],
+                "missing_critical_info": list(general_info),
+                "confidence": 0.0,
+            },
+            "brief_missing_info": list(general_info),
+            "brief_unknown_info": existing_unknown,
+            "brief_info_complete": False,
+            "brief_needs_full_intake": True,
+            "brief_pending_questions": [],
+            "brief_current_question_index": 0,
+            "brief_total_questions": 0,
+        }
 
     # Format conversation for analysis
     conversation = _format_conversation(messages)
@@ -396,8 +446,7 @@ async def brief_check_info_node(
         # Use internal config to suppress streaming
         internal_config = get_internal_llm_config(config)
 
-        llm = ChatOpenAI(model="gpt-4o", temperature=0)
-        structured_llm = llm.with_structured_output(ExtractedFacts)
+        structured_llm = _get_structured_llm("gpt-4o", 0, ExtractedFacts)
 
         facts = await structured_llm.ainvoke(
             FACT_EXTRACTION_PROMPT.format(
@@ -493,8 +542,7 @@ async def brief_ask_questions_node(
             # Use internal config to suppress streaming
             internal_config = get_internal_llm_config(config)
 
-            llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3)
-            structured_llm = llm.with_structured_output(FollowUpQuestions)
+            structured_llm = _get_structured_llm("gpt-4o-mini", 0.3, FollowUpQuestions)
 
             result = await structured_llm.ainvoke(
                 FOLLOW_UP_PROMPT.format(
@@ -530,7 +578,7 @@ async def brief_ask_questions_node(
                 question_text = f"{progress}\n\n{question}"
 
             # Use explicit message ID to prevent duplicates on checkpoint restore
-            msg_id = f"brief_q{current_index + 1}_{uuid.uuid4().hex[:8]}"
+            msg_id = f"brief_q{current_index + 1}_{secrets.token_hex(4)}"
             return {
                 "messages": [AIMessage(content=question_text, id=msg_id)],
                 "brief_questions_asked": questions_asked + 1,
@@ -553,7 +601,7 @@ async def brief_ask_questions_node(
         return {
             "messages": [AIMessage(
                 content="I'll prepare your brief with the information we have.",
-                id=f"brief_q_error_{uuid.uuid4().hex[:8]}"
+                id=f"brief_q_error_{secrets.token_hex(4)}"
             )],
             "brief_questions_asked": questions_asked + 1,
             "brief_info_complete": True,  # Force completion
@@ -593,8 +641,7 @@ async def brief_generate_node(
         # Use internal config to suppress streaming
         internal_config = get_internal_llm_config(config)
 
-        llm = ChatOpenAI(model="gpt-4o", temperature=0)
-        structured_llm = llm.with_structured_output(ConversationalBrief)
+        structured_llm = _get_structured_llm("gpt-4o", 0, ConversationalBrief)
 
         brief = await structured_llm.ainvoke(
             BRIEF_GENERATION_PROMPT.format(
@@ -616,7 +663,7 @@ async def brief_generate_node(
         return {
             "messages": [AIMessage(
                 content=formatted_brief,
-                id=f"brief_generated_{uuid.uuid4().hex[:8]}"
+                id=f"brief_generated_{secrets.token_hex(4)}"
             )],
             "mode": "chat",  # Return to chat mode
             "quick_replies": [
@@ -633,7 +680,7 @@ async def brief_generate_node(
             "messages": [AIMessage(
                 content="I apologize, but I encountered an issue generating your brief. "
                 "Please try again, or I can help you find a lawyer directly.",
-                id=f"brief_error_{uuid.uuid4().hex[:8]}"
+                id=f"brief_error_{secrets.token_hex(4)}"
             )],
             "mode": "chat",
             "quick_replies": ["Find me a lawyer", "Try again", "What can you help with?"],
@@ -667,24 +714,21 @@ def _format_facts_for_prompt(facts: dict) -> str:
 
     if facts.get("key_facts"):
         parts.append("**Key Facts:**")
-        for fact in facts["key_facts"]:
-            parts.append(f"- {fact}")
+        parts.extend(f"- {fact}" for fact in facts["key_facts"])
 
     if facts.get("parties_involved"):
         parts.append(f"**Parties:** {', '.join(facts['parties_involved'])}")
 
     if facts.get("timeline_events"):
         parts.append("**Timeline:**")
-        for event in facts["timeline_events"]:
-            parts.append(f"- {event}")
+        parts.extend(f"- {event}" for event in facts["timeline_events"])
 
     if facts.get("documents_mentioned"):
         parts.append(f"**Documents:** {', '.join(facts['documents_mentioned'])}")
 
     if facts.get("user_goals"):
         parts.append("**User Goals:**")
-        for goal in facts["user_goals"]:
-            parts.append(f"- {goal}")
+        parts.extend(f"- {goal}" for goal in facts["user_goals"])
 
     return "\n".join(parts)
 
@@ -701,19 +745,13 @@ def _format_brief_as_message(
         user_state: User's Australian state/territory
         unknown_info: Items the user explicitly said they don't know
     """
-    urgency_emoji = {
-        "urgent": "🔴",
-        "standard": "🟡",
-        "low_priority": "🟢",
-    }
-
     lines = [
         "# Lawyer Brief",
         "",
         f"## Summary",
         f"{brief.executive_summary}",
         "",
-        f"**Urgency:** {urgency_emoji.get(brief.urgency_level, '⚪')} {brief.urgency_level.replace('_', ' ').title()}",
+        f"**Urgency:** {URGENCY_EMOJI.get(brief.urgency_level, '⚪')} {brief.urgency_level.replace('_', ' ').title()}",
         f"*{brief.urgency_reason}*",
         "",
         f"**Legal Area:** {brief.legal_area.title()}",
@@ -728,8 +766,7 @@ def _format_brief_as_message(
 
     if brief.key_facts:
         lines.append("## Key Facts")
-        for fact in brief.key_facts:
-            lines.append(f"- {fact}")
+        lines.extend(f"- {fact}" for fact in brief.key_facts)
         lines.append("")
 
     if brief.parties:
@@ -738,41 +775,35 @@ def _format_brief_as_message(
 
     if brief.documents_evidence:
         lines.append("## Documents & Evidence")
-        for doc in brief.documents_evidence:
-            lines.append(f"- {doc}")
+        lines.extend(f"- {doc}" for doc in brief.documents_evidence)
         lines.append("")
 
     if brief.client_goals:
         lines.append("## Your Goals")
-        for goal in brief.client_goals:
-            lines.append(f"- {goal}")
+        lines.extend(f"- {goal}" for goal in brief.client_goals)
         lines.append("")
 
     # Show items user explicitly said they don't know
     if unknown_info:
         lines.append("## Information Not Provided")
         lines.append("*You indicated you don't know these details - the lawyer may need to discuss:*")
-        for item in unknown_info:
-            lines.append(f"- {item}")
+        lines.extend(f"- {item}" for item in unknown_info)
         lines.append("")
 
     if brief.fact_gaps:
         lines.append("## Information to Gather")
         lines.append("*These are things the lawyer may ask about:*")
-        for gap in brief.fact_gaps:
-            lines.append(f"- {gap}")
+        lines.extend(f"- {gap}" for gap in brief.fact_gaps)
         lines.append("")
 
     if brief.potential_issues:
         lines.append("## Potential Legal Issues")
-        for issue in brief.potential_issues:
-            lines.append(f"- {issue}")
+        lines.extend(f"- {issue}" for issue in brief.potential_issues)
         lines.append("")
 
     if brief.questions_for_lawyer:
         lines.append("## Questions for Your Lawyer")
-        for q in brief.questions_for_lawyer:
-            lines.append(f"- {q}")
+        lines.extend(f"- {q}" for q in brief.questions_for_lawyer)
         lines.append("")
 
     lines.extend([
@@ -4,6 +4,8 @@ Generates natural, helpful responses using tools (lookup_law, find_lawyer)
 when needed. Includes quick reply suggestions for smoother conversation flow.
 """
 
+from functools import lru_cache
+
 from pydantic import BaseModel, Field
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import AIMessage, SystemMessage, HumanMessage
@@ -188,6 +190,11 @@ If internal review fails, explain:
 - **Don't assume guilt**: Approach from "let's see if there are grounds to challenge"
 - **State-specific**: Fine processes differ significantly by state — always use the correct state's process"""
 
+# Topic playbooks keyed by legal_topic slug
+TOPIC_PLAYBOOKS = {
+    "parking_ticket": PARKING_TICKET_PLAYBOOK,
+}
+
 
 class QuickReplyAnalysis(BaseModel):
     """Analyze the conversation to suggest quick replies."""
@@ -234,12 +241,12 @@ async def generate_quick_replies(
 ) -> QuickReplyAnalysis:
     """Generate quick reply suggestions based on conversation context."""
     try:
-        # Format conversation for analysis
-        conversation = ""
-        for msg in messages[-6:]:  # Last 6 messages for context
-            role = "User" if isinstance(msg, HumanMessage) else "Assistant"
-            content = msg.content if hasattr(msg, 'content') else str(msg)
-            conversation += f"{role}: {content}\n"
+        # Format conversation for analysis (last 6 messages for context)
+        conversation = "".join(
+            f"{'User' if isinstance(msg, HumanMessage) else 'Assistant'}: "
+            f"{msg.content if hasattr(msg, 'content') else str(msg)}\n"
+            for msg in messages[-6:]
+        )
 
         # Use internal config to suppress streaming (prevents raw JSON in chat)
         internal_config = get_internal_llm_config(config)
@@ -265,21 +272,14 @@ async def generate_quick_replies(
         )
 
 
-def _create_chat_agent(user_state: str, has_document: bool, document_url: str = "", ui_mode: str = "chat", legal_topic: str = "general"):
-    """Create a ReAct agent with tools for chat.
-
-    Args:
-        user_state: User's Australian state/territory
-        has_document: Whether user has uploaded a document
-        document_url: Actual URL of uploaded document (for analyze_document tool)
-        ui_mode: "chat" for casual Q&A, "analysis" for guided intake
-        legal_topic: Legal domain ("general", "parking_ticket", etc.)
-    """
-    llm = ChatOpenAI(model="gpt-4o", temperature=0.3)
-
-    # Tools available for chat
-    tools = [lookup_law, find_lawyer, analyze_document, search_case_law, get_action_template]
-
+def _build_system_prompt(
+    user_state: str | None,
+    has_document: bool,
+    document_url: str,
+    ui_mode: str,
+    legal_topic: str,
+) -> str:
+    """Render the system prompt for a mode/topic/user context combination."""
     # Select base system prompt based on UI mode
     if ui_mode == "analysis":
         system_template = ANALYSIS_MODE_PROMPT
@@ -294,11 +294,34 @@ def _create_chat_agent(user_state: str, has_document: bool, document_url: str =
     )
 
     # Append topic playbook if not general
-    topic_playbooks = {
-        "parking_ticket": PARKING_TICKET_PLAYBOOK,
-    }
-    if legal_topic in topic_playbooks:
-        system += topic_playbooks[legal_topic]
+    if legal_topic in TOPIC_PLAYBOOKS:
+        system += TOPIC_PLAYBOOKS[legal_topic]
+
+    return system
+
+
+@lru_cache(maxsize=32)
+def _create_chat_agent(user_state: str | None, has_document: bool, document_url: str = "", ui_mode: str = "chat", legal_topic: str = "general"):
+    """Create a ReAct agent with tools for chat.
+
+    Cached per argument combination: the compiled agent holds no per-request
+    state, so follow-up turns reuse it instead of rebuilding the LLM client
+    and recompiling the ReAct graph. Call _create_chat_agent.cache_clear()
+    to force a rebuild.
+
+    Args:
+        user_state: User's Australian state/territory
+        has_document: Whether user has uploaded a document
+        document_url: Actual URL of uploaded document (for analyze_document tool)
+        ui_mode: "chat" for casual Q&A, "analysis" for guided intake
+        legal_topic: Legal domain ("general", "parking_ticket", etc.)
+    """
+    llm = ChatOpenAI(model="gpt-4o", temperature=0.3)
+
+    # Tools available for chat
+    tools = [lookup_law, find_lawyer, analyze_document, search_case_law, get_action_template]
+
+    system = _build_system_prompt(user_state, has_document, document_url or "", ui_mode, legal_topic)
 
     # Create ReAct agent
     agent = create_react_agent(
@@ -37,6 +37,13 @@ CRISIS_KEYWORDS = {
     ],
 }
 
+# One compiled alternation per category, so each category costs a single scan.
+# Dict order is preserved, keeping the category precedence of CRISIS_KEYWORDS.
+_CRISIS_PATTERNS = {
+    category: re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+    for category, patterns in CRISIS_KEYWORDS.items()
+}
+
 # Keywords that might indicate risk - need LLM to verify
 UNCERTAIN_KEYWORDS = [
     r"\b(court|hearing|deadline|tomorrow|next week)\b",
@@ -46,6 +53,11 @@ UNCERTAIN_KEYWORDS = [
     r"\b(hurt|pain|danger)\b",
 ]
 
+# Single alternation so _might_be_risky scans the query once
+_UNCERTAIN_PATTERN = re.compile(
+    "|".join(f"(?:{p})" for p in UNCERTAIN_KEYWORDS), re.IGNORECASE
+)
+
 
 class SafetyAssessment(BaseModel):
     """LLM safety assessment result."""
@@ -108,23 +120,16 @@ def _check_crisis_keywords(query: str) -> tuple[bool, str | None]:
     """
     query_lower = query.lower()
 
-    for category, patterns in CRISIS_KEYWORDS.items():
-        for pattern in patterns:
-            if re.search(pattern, query_lower, re.IGNORECASE):
-                return True, category
+    for category, pattern in _CRISIS_PATTERNS.items():
+        if pattern.search(query_lower):
+            return True, category
 
     return False, None
 
 
 def _might_be_risky(query: str) -> bool:
     """Check if query contains uncertain keywords that need LLM verification."""
-    query_lower = query.lower()
-
-    for pattern in UNCERTAIN_KEYWORDS:
-        if re.search(pattern, query_lower, re.IGNORECASE):
-            return True
-
-    return False
+    return _UNCERTAIN_PATTERN.search(query) is not None
 
 
 async def safety_check_lite_node(
@@ -202,33 +207,11 @@ def route_after_safety_lite(state: ConversationalState) -> str:
     return "continue"
 
 
-def format_escalation_response_lite(state: ConversationalState) -> dict:
-    """
-    Format a compassionate response for crisis situations.
-
-    Uses the crisis resources from the safety check.
-    """
-    resources = state.get("crisis_resources", [])
-
-    # Format resources
-    resource_lines = []
-    for resource in resources:
-        line = f"**{resource['name']}**"
-        if resource.get("phone"):
-            line += f" - {resource['phone']}"
-        if resource.get("description"):
-            line += f"\n  _{resource['description']}_"
-        if resource.get("url"):
-            line += f"\n  {resource['url']}"
-        resource_lines.append(line)
-
-    resources_text = "\n\n".join(resource_lines) if resource_lines else ""
-
-    message = f"""I'm concerned about what you've shared. Your safety and wellbeing come first.
+ESCALATION_MESSAGE_TEMPLATE = """I'm concerned about what you've shared. Your safety and wellbeing come first.
 
 **Please contact these services for immediate support:**
 
-{resources_text}
+{resources}
 
 ---
 
@@ -236,6 +219,31 @@ These services are free and confidential. They can provide the urgent, professio
 
 If you have other legal questions that aren't urgent safety matters, I'm still here to help with general legal information."""
 
+
+def _format_resource(resource: dict) -> str:
+    """Render one resource entry for the escalation message."""
+    line = f"**{resource['name']}**"
+    if resource.get("phone"):
+        line += f" - {resource['phone']}"
+    if resource.get("description"):
+        line += f"\n  _{resource['description']}_"
+    if resource.get("url"):
+        line += f"\n  {resource['url']}"
+    return line
+
+
+def format_escalation_response_lite(state: ConversationalState) -> dict:
+    """
+    Format a compassionate response for crisis situations.
+
+    Uses the crisis resources from the safety check.
+    """
+    resources = state.get("crisis_resources", [])
+
+    resources_text = "\n\n".join(_format_resource(r) for r in resources)
+
+    message = ESCALATION_MESSAGE_TEMPLATE.format(resources=resources_text)
+
     return {
         "messages": [AIMessage(content=message)],
     }
@@ -1,6 +1,22 @@
-from .embedding_service import EmbeddingService
-from .hybrid_retriever import HybridRetriever
-from .reranker import CohereReranker
-from .austlii_search import AustLIISearcher
+import importlib
+
+# Service classes are resolved lazily (PEP 562) so that importing one
+# submodule, e.g. app.services.austlii_search, doesn't pull in the OpenAI,
+# Supabase and Cohere clients used by the others.
+_LAZY_EXPORTS = {
+    "EmbeddingService": ".embedding_service",
+    "HybridRetriever": ".hybrid_retriever",
+    "CohereReranker": ".reranker",
+    "AustLIISearcher": ".austlii_search",
+}
 
 __all__ = ["EmbeddingService", "HybridRetriever", "CohereReranker", "AustLIISearcher"]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
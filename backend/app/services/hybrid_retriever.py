@@ -6,6 +6,7 @@ Reciprocal Rank Fusion (RRF) for optimal retrieval performance.
 """
 
 import asyncio
+import heapq
 from typing import List, Dict, Optional
 from app.db import supabase
 from app.services.embedding_service import get_embedding_service
@@ -66,26 +67,24 @@ class HybridRetriever:
             # Apply RRF scoring
             results = self._apply_rrf(response.data)
 
-            # Sort by RRF score
-            sorted_results = sorted(
-                results,
-                key=lambda x: x.get("rrf_score", 0),
-                reverse=True
-            )
-
-            # Filter out very weak matches
+            # Filter out very weak matches before ranking
             filtered_results = [
-                r for r in sorted_results
+                r for r in results
                 if r.get("rrf_score", 0) >= self.MIN_RRF_SCORE
             ]
 
-            if len(filtered_results) < len(sorted_results):
+            if len(filtered_results) < len(results):
                 logger.debug(
-                    f"Filtered {len(sorted_results) - len(filtered_results)} weak RRF matches "
+                    f"Filtered {len(results) - len(filtered_results)} weak RRF matches "
                     f"(threshold: {self.MIN_RRF_SCORE})"
                 )
 
-            return filtered_results[:top_k]
+            # Top-k by RRF score (same order as a full descending sort)
+            return heapq.nlargest(
+                top_k,
+                filtered_results,
+                key=lambda x: x.get("rrf_score", 0)
+            )
 
         except Exception as e:
             logger.error(f"Hybrid search error: {e}")
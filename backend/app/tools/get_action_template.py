@@ -47,14 +47,16 @@ def get_action_template(query: str, state: str, category: str = "") -> str | lis
         query_words = set(query.lower().split())
         scored_results = []
         for template in response.data:
-            keywords = template.get("keywords", []) or []
+            # Query words contain no whitespace, so a substring search over the
+            # newline-joined keywords matches exactly when some keyword does
+            keyword_text = "\n".join(template.get("keywords", []) or [])
             title = template.get("title", "").lower()
             description = template.get("description", "").lower()
 
             # Score by keyword overlap
             score = 0
             for word in query_words:
-                if any(word in kw for kw in keywords):
+                if word in keyword_text:
                     score += 2
                 if word in title:
                     score += 1
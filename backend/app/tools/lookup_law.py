@@ -42,6 +42,30 @@ def lookup_law(query: str, state: str) -> str | list[dict]:
         List of matching legal passages with citations and source URLs,
         or error message if search fails.
     """
+    coro = lookup_law_async(query, state)
+    try:
+        return asyncio.run(coro)
+    except Exception as e:
+        # e.g. called from a thread with a running loop; don't leak the coroutine
+        coro.close()
+        logger.error(f"Error in lookup_law: {e}")
+        return "Sorry, I couldn't search the legal database at this time. Please try again later."
+
+
+async def lookup_law_async(query: str, state: str) -> str | list[dict]:
+    """
+    Async implementation of lookup_law.
+
+    Runs search, reranking and any AustLII fallback on the caller's event
+    loop, so batch callers can share one loop (and its HTTP clients).
+
+    Args:
+        query: Legal question or keywords
+        state: Australian state/territory code
+
+    Returns:
+        Same as lookup_law.
+    """
     try:
         # Check if we have RAG data for this state
         jurisdiction = RAG_JURISDICTIONS.get(state)
@@ -52,15 +76,13 @@ def lookup_law(query: str, state: str) -> str | list[dict]:
         # States without RAG data: search AustLII directly
         if not has_rag:
             logger.info(f"No RAG data for {state}, searching AustLII directly")
-            austlii_results = asyncio.run(
-                _austlii_legislation_fallback(query, state)
-            )
+            austlii_results = await _austlii_legislation_fallback(query, state)
             if austlii_results:
                 return austlii_results
             return f"No legislation found for '{query}' in {state}. Try different keywords."
 
         # States with RAG data: search RAG first
-        results = asyncio.run(_search_and_rerank(query, jurisdiction))
+        results = await _search_and_rerank(query, jurisdiction)
 
         # Assess result quality and try AustLII fallback if needed
         rag_quality = _assess_result_quality(results) if results else "no_results"
@@ -70,9 +92,7 @@ def lookup_law(query: str, state: str) -> str | list[dict]:
             logger.info(
                 f"RAG quality={rag_quality}, trying AustLII fallback for '{query}' in {state}"
             )
-            fallback_results = asyncio.run(
-                _austlii_legislation_fallback(query, state)
-            )
+            fallback_results = await _austlii_legislation_fallback(query, state)
             if fallback_results:
                 return fallback_results
 
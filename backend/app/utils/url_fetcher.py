@@ -13,10 +13,12 @@ MAX_FETCH_SIZE_BYTES = 10 * 1024 * 1024
 
 # Security: Allowed hosts for document fetching (SSRF protection)
 # Add your Supabase project URL domain here
-ALLOWED_HOSTS = []
-_extra_hosts = os.environ.get("ALLOWED_DOCUMENT_HOSTS", "")
-if _extra_hosts:
-    ALLOWED_HOSTS.extend([h.strip() for h in _extra_hosts.split(",") if h.strip()])
+# Lowercased tuple so is_safe_url can match every suffix in one endswith call
+ALLOWED_HOSTS = tuple(
+    h.strip().lower()
+    for h in os.environ.get("ALLOWED_DOCUMENT_HOSTS", "").split(",")
+    if h.strip()
+)
 
 
 def is_safe_url(url: str) -> bool:
@@ -56,7 +58,7 @@ def is_safe_url(url: str) -> bool:
 
         # Check allowlist if configured
         if ALLOWED_HOSTS:
-            if not any(hostname_lower.endswith(allowed.lower()) for allowed in ALLOWED_HOSTS):
+            if not hostname_lower.endswith(ALLOWED_HOSTS):
                 return False
 
         return True
@@ -11,9 +11,11 @@ Usage:
     python scripts/eval_rag.py --verbose    # Show detailed results
     python scripts/eval_rag.py --stats      # Show DB statistics first
     python scripts/eval_rag.py --static     # Use hardcoded test cases instead
+    python scripts/eval_rag.py -c 1         # Run lookups sequentially
 """
 
 import argparse
+import asyncio
 import re
 import sys
 from pathlib import Path
@@ -22,7 +24,7 @@ from dataclasses import dataclass
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.tools.lookup_law import lookup_law
+from app.tools.lookup_law import lookup_law_async
 from app.db import supabase
 
 
@@ -176,72 +178,123 @@ def check_citation_match(retrieved: str, expected_list: list[str]) -> list[str]:
     return matches
 
 
-def evaluate_case(case: EvalCase) -> EvalResult:
+def _build_result(case: EvalCase, results: str | list[dict]) -> EvalResult:
     """
-    Evaluate a single test case.
+    Score the lookup_law output for a single test case.
 
     Args:
-        case: The evaluation case to test
+        case: The evaluation case that was run
+        results: lookup_law output (error string or list of results)
 
     Returns:
         EvalResult with success/failure and details
     """
-    try:
-        # Call the lookup_law tool
-        results = lookup_law.invoke({
-            "query": case.query,
-            "state": case.jurisdiction
-        })
-
-        # Handle error string response
-        if isinstance(results, str):
-            return EvalResult(
-                case=case,
-                success=False,
-                retrieved_citations=[],
-                matched_expected=[],
-                error=results
-            )
-
-        # Filter out note dictionaries (for unsupported states)
-        results = [r for r in results if "citation" in r]
-
-        # Extract citations from results
-        retrieved_citations = [r.get("citation", "") for r in results]
-
-        # Check which expected citations were found
-        all_matches = set()
-        for citation in retrieved_citations:
-            matches = check_citation_match(citation, case.expected_citations)
-            all_matches.update(matches)
-
-        # Success if at least one expected citation was found
-        success = len(all_matches) > 0
-
-        return EvalResult(
-            case=case,
-            success=success,
-            retrieved_citations=retrieved_citations,
-            matched_expected=list(all_matches)
-        )
-
-    except Exception as e:
+    # Handle error string response
+    if isinstance(results, str):
         return EvalResult(
             case=case,
             success=False,
             retrieved_citations=[],
             matched_expected=[],
-            error=str(e)
+            error=results
         )
 
+    # Filter out note dictionaries (for unsupported states)
+    results = [r for r in results if "citation" in r]
+
+    # Extract citations from results
+    retrieved_citations = [r.get("citation", "") for r in results]
+
+    # Check which expected citations were found
+    all_matches = set()
+    for citation in retrieved_citations:
+        matches = check_citation_match(citation, case.expected_citations)
+        all_matches.update(matches)
+
+    # Success if at least one expected citation was found
+    success = len(all_matches) > 0
 
-def run_evaluation(verbose: bool = False, use_static: bool = False) -> dict:
+    return EvalResult(
+        case=case,
+        success=success,
+        retrieved_citations=retrieved_citations,
+        matched_expected=list(all_matches)
+    )
+
+
+def _error_result(case: EvalCase, error: Exception) -> EvalResult:
+    """Build a failed EvalResult for a case whose lookup raised."""
+    return EvalResult(
+        case=case,
+        success=False,
+        retrieved_citations=[],
+        matched_expected=[],
+        error=str(error)
+    )
+
+
+async def evaluate_case(case: EvalCase, semaphore: asyncio.Semaphore) -> EvalResult:
+    """
+    Evaluate a single test case.
+
+    Args:
+        case: The evaluation case to test
+        semaphore: Bounds how many lookups are in flight at once
+
+    Returns:
+        EvalResult with success/failure and details
+    """
+    async with semaphore:
+        try:
+            results = await lookup_law_async(case.query, case.jurisdiction)
+        except Exception as e:
+            return _error_result(case, e)
+    return _build_result(case, results)
+
+
+async def evaluate_cases(
+    cases: list[EvalCase],
+    max_concurrency: int = 4,
+    on_result=None,
+) -> list[EvalResult]:
+    """
+    Evaluate test cases concurrently on a single event loop.
+
+    Each lookup is I/O bound (embedding, Supabase, reranker, AustLII), so
+    running several at once cuts wall-clock time. All lookups share one
+    loop, so the singleton async clients are never used across loops.
+
+    Args:
+        cases: The evaluation cases to test
+        max_concurrency: Maximum lookups in flight at once
+        on_result: Optional callback invoked as each case completes
+
+    Returns:
+        List of EvalResult, in the same order as cases
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(case: EvalCase) -> EvalResult:
+        result = await evaluate_case(case, semaphore)
+        if on_result:
+            on_result(result)
+        return result
+
+    return await asyncio.gather(*(run(case) for case in cases))
+
+
+def run_evaluation(
+    verbose: bool = False,
+    use_static: bool = False,
+    concurrency: int = 4,
+) -> dict:
     """
     Run the full evaluation suite.
 
     Args:
         verbose: Whether to print detailed output per case
         use_static: Use static test cases instead of generating from DB
+        concurrency: Maximum lookups to run at once
 
     Returns:
         Dictionary with evaluation metrics
@@ -260,18 +313,19 @@ def run_evaluation(verbose: bool = False, use_static: bool = False) -> dict:
 
     print(f"Running {len(eval_cases)} test cases...\n")
 
-    results: list[EvalResult] = []
+    completed = 0
 
-    for i, case in enumerate(eval_cases, 1):
-        result = evaluate_case(case)
-        results.append(result)
+    def print_result(result: EvalResult) -> None:
+        nonlocal completed
+        completed += 1
+        case = result.case
 
         # Progress indicator
         status = "PASS" if result.success else "FAIL"
         status_color = "\033[92m" if result.success else "\033[91m"
         reset_color = "\033[0m"
 
-        print(f"[{i:2d}/{len(eval_cases)}] {status_color}{status}{reset_color} | {case.jurisdiction:7s} | {case.query[:45]}")
+        print(f"[{completed:2d}/{len(eval_cases)}] {status_color}{status}{reset_color} | {case.jurisdiction:7s} | {case.query[:45]}")
 
         if verbose:
             print(f"       Expected: {case.expected_citations}")
@@ -282,6 +336,10 @@ def run_evaluation(verbose: bool = False, use_static: bool = False) -> dict:
                 print(f"       Error: {result.error}")
             print()
 
+    results = asyncio.run(
+        evaluate_cases(eval_cases, max_concurrency=concurrency, on_result=print_result)
+    )
+
     # Calculate metrics
     total = len(results)
     passed = sum(1 for r in results if r.success)
@@ -372,12 +430,22 @@ def main():
         action="store_true",
         help="Show database statistics before running"
     )
+    parser.add_argument(
+        "--concurrency", "-c",
+        type=int,
+        default=4,
+        help="Maximum lookups to run at once (default: 4, use 1 for sequential)"
+    )
     args = parser.parse_args()
 
     if args.stats:
         show_database_stats()
 
-    metrics = run_evaluation(verbose=args.verbose, use_static=args.static)
+    metrics = run_evaluation(
+        verbose=args.verbose,
+        use_static=args.static,
+        concurrency=args.concurrency,
+    )
 
     # Exit with error code if pass rate is below threshold
     if metrics["pass_rate"] < 0.7:
@@ -14,6 +14,7 @@ Options:
     --dry-run       Preview what would be ingested without making changes
     --limit N       Only process first N documents (for testing)
     --batch-size N  Embedding batch size (default: 20)
+    --concurrency N Max embedding requests in flight per document (default: 4)
     --max-doc-size  Maximum document size in chars (default: 500000)
 """
 
@@ -176,9 +177,17 @@ class DocumentChunker:
 class CorpusIngester:
     """Handles ingestion of legal corpus into Supabase."""
 
-    def __init__(self, dry_run: bool = False, batch_size: int = 20, max_doc_size: int = MAX_DOC_SIZE):
+    def __init__(
+        self,
+        dry_run: bool = False,
+        batch_size: int = 20,
+        max_doc_size: int = MAX_DOC_SIZE,
+        concurrency: int = 4,
+    ):
         self.dry_run = dry_run
         self.batch_size = batch_size
+        # Caps in-flight embedding requests to stay under OpenAI rate limits
+        self.embed_semaphore = asyncio.Semaphore(concurrency)
         self.max_doc_size = max_doc_size
         self.chunker = DocumentChunker()
         self.embedding_service = EmbeddingService()
@@ -307,13 +316,22 @@ class CorpusIngester:
             # Generate embeddings in smaller batches to save memory
             chunk_texts = [c["content"] for c in chunks]
 
-            # Process embeddings in batches
-            all_embeddings = []
-            for i in range(0, len(chunk_texts), self.batch_size):
-                batch = chunk_texts[i:i + self.batch_size]
-                batch_embeddings = await self.embedding_service.embed_batch(batch, batch_size=self.batch_size)
-                all_embeddings.extend(batch_embeddings)
-                self.stats["embeddings_generated"] += len(batch_embeddings)
+            # Process embedding batches concurrently; a failed batch cancels the rest
+            batches = [
+                chunk_texts[i:i + self.batch_size]
+                for i in range(0, len(chunk_texts), self.batch_size)
+            ]
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [
+                        tg.create_task(self._embed_batch_bounded(batch))
+                        for batch in batches
+                    ]
+            except ExceptionGroup as eg:
+                # Surface the underlying batch error in the per-document log
+                raise eg.exceptions[0]
+            all_embeddings = [e for task in tasks for e in task.result()]
+            self.stats["embeddings_generated"] += len(all_embeddings)
 
 
             # First pass: batch insert parent chunks
@@ -385,6 +403,11 @@ class CorpusIngester:
             gc.collect()
             return None
 
+    async def _embed_batch_bounded(self, batch: List[str]) -> List[List[float]]:
+        """Embed one batch, waiting for a free concurrency slot first."""
+        async with self.embed_semaphore:
+            return await self.embedding_service.embed_batch(batch, batch_size=self.batch_size)
+
     async def run(self, limit: Optional[int] = None):
         """
         Run the full ingestion process.
@@ -435,13 +458,15 @@ def main():
     parser.add_argument("--limit", type=int, help="Limit number of documents to process")
     parser.add_argument("--batch-size", type=int, default=20, help="Embedding batch size (default: 20)")
     parser.add_argument("--max-doc-size", type=int, default=MAX_DOC_SIZE, help="Max document size in chars")
+    parser.add_argument("--concurrency", type=int, default=4, help="Max concurrent embedding requests (default: 4)")
 
     args = parser.parse_args()
 
     ingester = CorpusIngester(
         dry_run=args.dry_run,
         batch_size=args.batch_size,
-        max_doc_size=args.max_doc_size
+        max_doc_size=args.max_doc_size,
+        concurrency=args.concurrency,
     )
 
     asyncio.run(ingester.run(limit=args.limit))
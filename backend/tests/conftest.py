@@ -2,6 +2,8 @@
 
 import os
 import sys
+from types import MappingProxyType
+
 import pytest
 
 # Add backend to path for imports
@@ -11,6 +13,42 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from dotenv import load_dotenv
 load_dotenv()
 
+from app.agents.conversational_state import ConversationalState
+
+
+# Read-only ConversationalState template shared by the graph and brief tests
+BASE_STATE = MappingProxyType({
+    "messages": [],
+    "session_id": "test",
+    "current_query": "",
+    "user_state": None,
+    "uploaded_document_url": None,
+    "mode": "chat",
+    "is_first_message": False,
+    "quick_replies": None,
+    "suggest_brief": False,
+    "suggest_lawyer": False,
+    "safety_result": "unknown",
+    "crisis_resources": None,
+    "brief_facts_collected": None,
+    "brief_missing_info": None,
+    "brief_unknown_info": None,
+    "brief_info_complete": False,
+    "brief_questions_asked": 0,
+    "brief_needs_full_intake": False,
+    "copilotkit": None,
+    "error": None,
+})
+
+
+def create_test_state(**overrides) -> ConversationalState:
+    """Build a fresh state from BASE_STATE with the given overrides.
+
+    Shallow-copies the template; only the messages list is mutable, so each
+    state gets a fresh one.
+    """
+    return {**BASE_STATE, "messages": [], **overrides}
+
 
 @pytest.fixture
 def sample_query():
@@ -46,3 +84,10 @@ def safe_urls():
         "https://example.com/document.pdf",
         "https://storage.googleapis.com/bucket/file.pdf",
     ]
+
+
+@pytest.fixture(scope="session")
+def conversational_workflow():
+    """Uncompiled conversational graph, built once per test session."""
+    from app.agents.conversational_graph import build_conversational_graph
+    return build_conversational_graph()
@@ -1,12 +1,10 @@
 """Tests for Phase 3: Brief Generation Mode."""
 
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
 from langchain_core.messages import HumanMessage, AIMessage
 
 from app.agents.conversational_state import ConversationalState
 from app.agents.conversational_graph import (
-    build_conversational_graph,
     route_after_initialize,
     route_brief_info,
     BRIEF_TRIGGER,
@@ -21,36 +19,72 @@ from app.agents.stages.brief_flow import (
     _detect_skip_response,
     _detect_generate_now,
     ExtractedFacts,
+    FollowUpQuestions,
     ConversationalBrief,
+    REQUIRED_INFO_BY_AREA,
+    _get_structured_llm,
 )
+from tests.conftest import create_test_state
 
 
 def _create_test_state(**overrides) -> ConversationalState:
-    """Helper to create a test state with sensible defaults."""
-    base_state: ConversationalState = {
-        "messages": [],
-        "session_id": "test-session",
-        "current_query": "",
-        "user_state": "NSW",
-        "uploaded_document_url": None,
-        "mode": "chat",
-        "is_first_message": False,
-        "quick_replies": None,
-        "suggest_brief": False,
-        "suggest_lawyer": False,
-        "safety_result": "unknown",
-        "crisis_resources": None,
-        "brief_facts_collected": None,
-        "brief_missing_info": None,
-        "brief_unknown_info": None,
-        "brief_info_complete": False,
-        "brief_questions_asked": 0,
-        "brief_needs_full_intake": False,
-        "copilotkit": None,
-        "error": None,
-    }
-    base_state.update(overrides)
-    return base_state
+    """Helper to create a test state for an NSW brief session."""
+    return create_test_state(**{"session_id": "test-session", "user_state": "NSW", **overrides})
+
+
+_BRIEF_DEFAULTS = {
+    "executive_summary": "Test case",
+    "legal_area": "tenancy",
+    "jurisdiction": "NSW",
+    "situation_narrative": "Tenant dispute.",
+    "key_facts": [],
+    "fact_gaps": [],
+    "parties": [],
+    "documents_evidence": [],
+    "client_goals": [],
+    "potential_issues": [],
+    "questions_for_lawyer": [],
+    "urgency_level": "standard",
+    "urgency_reason": "No immediate deadline",
+}
+
+
+def _make_brief(**overrides) -> ConversationalBrief:
+    """Helper to build a brief, overriding only the fields a test cares about."""
+    return ConversationalBrief(**{**_BRIEF_DEFAULTS, **overrides})
+
+
+class _StubLLM:
+    """Minimal stand-in for ChatOpenAI with structured output.
+
+    with_structured_output returns the stub itself and ainvoke returns
+    whatever the test stored in ``response``. Each prompt passed to
+    ainvoke is recorded in ``calls``.
+    """
+
+    def __init__(self):
+        self.response = None
+        self.calls = []
+
+    def with_structured_output(self, schema):
+        return self
+
+    async def ainvoke(self, messages, config=None):
+        self.calls.append(messages)
+        return self.response
+
+
+@pytest.fixture
+def mock_structured_llm(monkeypatch):
+    """Patch brief_flow's ChatOpenAI; set .response per test."""
+    stub = _StubLLM()
+    monkeypatch.setattr(
+        "app.agents.stages.brief_flow.ChatOpenAI",
+        lambda **kwargs: stub,
+    )
+    _get_structured_llm.cache_clear()
+    yield stub
+    _get_structured_llm.cache_clear()
 
 
 class TestBriefTriggerDetection:
@@ -269,20 +303,12 @@ class TestFormatBriefAsMessage:
 
     def test_format_brief_includes_unknown_info(self):
         """Brief includes unknown info section when provided."""
-        brief = ConversationalBrief(
-            executive_summary="Test case",
-            legal_area="tenancy",
-            jurisdiction="NSW",
-            situation_narrative="Tenant dispute.",
+        brief = _make_brief(
             key_facts=["Rent was increased"],
-            fact_gaps=[],
             parties=["Tenant", "Landlord"],
-            documents_evidence=[],
             client_goals=["Dispute the increase"],
             potential_issues=["Excessive rent increase"],
             questions_for_lawyer=["Is this legal?"],
-            urgency_level="standard",
-            urgency_reason="No immediate deadline",
         )
         unknown_info = ["Type of lease", "Exact date of rent increase"]
         result = _format_brief_as_message(brief, "NSW", unknown_info)
@@ -292,15 +318,11 @@ class TestFormatBriefAsMessage:
 
     def test_format_brief_no_unknown_section_when_empty(self):
         """Brief omits unknown section when no unknown info."""
-        brief = ConversationalBrief(
+        brief = _make_brief(
             executive_summary="Complete case",
-            legal_area="tenancy",
-            jurisdiction="NSW",
             situation_narrative="All info provided.",
             key_facts=["Fact 1"],
-            fact_gaps=[],
             parties=["Tenant"],
-            documents_evidence=[],
             client_goals=["Goal"],
             potential_issues=["Issue"],
             questions_for_lawyer=["Question"],
@@ -314,27 +336,26 @@ class TestFormatBriefAsMessage:
 class TestGraphIncludesBriefNodes:
     """Test that the graph includes brief mode nodes."""
 
-    def test_graph_has_brief_nodes(self):
+    def test_graph_has_brief_nodes(self, conversational_workflow):
         """Graph should include all brief mode nodes."""
-        workflow = build_conversational_graph()
-        assert "brief_check_info" in workflow.nodes
-        assert "brief_ask_questions" in workflow.nodes
-        assert "brief_generate" in workflow.nodes
+        nodes = conversational_workflow.nodes
+        assert "brief_check_info" in nodes
+        assert "brief_ask_questions" in nodes
+        assert "brief_generate" in nodes
 
-    def test_graph_still_has_chat_nodes(self):
+    def test_graph_still_has_chat_nodes(self, conversational_workflow):
         """Graph should still have chat mode nodes."""
-        workflow = build_conversational_graph()
-        assert "initialize" in workflow.nodes
-        assert "safety_check" in workflow.nodes
-        assert "chat_response" in workflow.nodes
-        assert "escalation_response" in workflow.nodes
+        nodes = conversational_workflow.nodes
+        assert "initialize" in nodes
+        assert "safety_check" in nodes
+        assert "chat_response" in nodes
+        assert "escalation_response" in nodes
 
 
 class TestBriefCheckInfoNode:
     """Test the brief info check node."""
 
-    @pytest.mark.asyncio
-    async def test_extracts_facts_from_conversation(self):
+    async def test_extracts_facts_from_conversation(self, mock_structured_llm):
         """Node extracts facts from conversation history."""
         state = _create_test_state(
             messages=[
@@ -358,21 +379,33 @@ class TestBriefCheckInfoNode:
             confidence=0.7,
         )
 
-        with patch("app.agents.stages.brief_flow.ChatOpenAI") as mock_llm_class:
-            mock_llm = MagicMock()
-            mock_structured = MagicMock()
-            mock_structured.ainvoke = AsyncMock(return_value=mock_facts)
-            mock_llm.with_structured_output.return_value = mock_structured
-            mock_llm_class.return_value = mock_llm
+        mock_structured_llm.response = mock_facts
 
-            result = await brief_check_info_node(state, {})
+        result = await brief_check_info_node(state, {})
 
         assert result["brief_facts_collected"]["legal_area"] == "tenancy"
         assert "30% rent increase" in result["brief_facts_collected"]["key_facts"]
         assert len(result["brief_missing_info"]) == 2
 
-    @pytest.mark.asyncio
-    async def test_marks_complete_when_confident(self):
+        # The conversation is passed to the extraction prompt
+        assert len(mock_structured_llm.calls) == 1
+        assert "My landlord increased rent by 30%" in mock_structured_llm.calls[0]
+
+    async def test_empty_conversation_skips_llm(self, mock_structured_llm):
+        """Node starts a full intake without an LLM call when nothing was said."""
+        state = _create_test_state(
+            messages=[HumanMessage(content="[GENERATE_BRIEF]")],
+        )
+
+        result = await brief_check_info_node(state, {})
+
+        assert result["brief_facts_collected"]["legal_area"] == "general"
+        assert result["brief_missing_info"] == REQUIRED_INFO_BY_AREA["general"]
+        assert result["brief_info_complete"] is False
+        assert result["brief_needs_full_intake"] is True
+        assert mock_structured_llm.calls == []
+
+    async def test_marks_complete_when_confident(self, mock_structured_llm):
         """Node marks info complete when confidence is high."""
         state = _create_test_state(
             messages=[
@@ -392,14 +425,9 @@ class TestBriefCheckInfoNode:
             confidence=0.8,
         )
 
-        with patch("app.agents.stages.brief_flow.ChatOpenAI") as mock_llm_class:
-            mock_llm = MagicMock()
-            mock_structured = MagicMock()
-            mock_structured.ainvoke = AsyncMock(return_value=mock_facts)
-            mock_llm.with_structured_output.return_value = mock_structured
-            mock_llm_class.return_value = mock_llm
+        mock_structured_llm.response = mock_facts
 
-            result = await brief_check_info_node(state, {})
+        result = await brief_check_info_node(state, {})
 
         assert result["brief_info_complete"] is True
 
@@ -407,8 +435,7 @@ class TestBriefCheckInfoNode:
 class TestBriefAskQuestionsNode:
     """Test the brief questions node."""
 
-    @pytest.mark.asyncio
-    async def test_generates_follow_up_questions(self):
+    async def test_generates_follow_up_questions(self, mock_structured_llm):
         """Node generates natural follow-up questions."""
         state = _create_test_state(
             brief_facts_collected={
@@ -419,7 +446,6 @@ class TestBriefAskQuestionsNode:
             brief_questions_asked=0,
         )
 
-        from app.agents.stages.brief_flow import FollowUpQuestions
         mock_questions = FollowUpQuestions(
             questions=[
                 "Is your lease fixed-term or periodic?",
@@ -428,22 +454,16 @@ class TestBriefAskQuestionsNode:
             question_context="Need lease details for accurate brief",
         )
 
-        with patch("app.agents.stages.brief_flow.ChatOpenAI") as mock_llm_class:
-            mock_llm = MagicMock()
-            mock_structured = MagicMock()
-            mock_structured.ainvoke = AsyncMock(return_value=mock_questions)
-            mock_llm.with_structured_output.return_value = mock_structured
-            mock_llm_class.return_value = mock_llm
+        mock_structured_llm.response = mock_questions
 
-            result = await brief_ask_questions_node(state, {})
+        result = await brief_ask_questions_node(state, {})
 
         assert "messages" in result
         assert len(result["messages"]) == 1
         assert "fixed-term or periodic" in result["messages"][0].content
         assert result["brief_questions_asked"] == 1
 
-    @pytest.mark.asyncio
-    async def test_includes_quick_replies(self):
+    async def test_includes_quick_replies(self, mock_structured_llm):
         """Node includes quick reply options."""
         state = _create_test_state(
             brief_facts_collected={"situation_summary": "Test"},
@@ -451,20 +471,14 @@ class TestBriefAskQuestionsNode:
             brief_questions_asked=0,
         )
 
-        from app.agents.stages.brief_flow import FollowUpQuestions
         mock_questions = FollowUpQuestions(
             questions=["What happened?"],
             question_context="Need details",
         )
 
-        with patch("app.agents.stages.brief_flow.ChatOpenAI") as mock_llm_class:
-            mock_llm = MagicMock()
-            mock_structured = MagicMock()
-            mock_structured.ainvoke = AsyncMock(return_value=mock_questions)
-            mock_llm.with_structured_output.return_value = mock_structured
-            mock_llm_class.return_value = mock_llm
+        mock_structured_llm.response = mock_questions
 
-            result = await brief_ask_questions_node(state, {})
+        result = await brief_ask_questions_node(state, {})
 
         assert "quick_replies" in result
         assert "I don't know" in result["quick_replies"]
@@ -473,8 +487,7 @@ class TestBriefAskQuestionsNode:
 class TestBriefGenerateNode:
     """Test the brief generation node."""
 
-    @pytest.mark.asyncio
-    async def test_generates_comprehensive_brief(self):
+    async def test_generates_comprehensive_brief(self, mock_structured_llm):
         """Node generates a comprehensive brief."""
         state = _create_test_state(
             messages=[
@@ -505,14 +518,9 @@ class TestBriefGenerateNode:
             urgency_reason="Should act before increase takes effect",
         )
 
-        with patch("app.agents.stages.brief_flow.ChatOpenAI") as mock_llm_class:
-            mock_llm = MagicMock()
-            mock_structured = MagicMock()
-            mock_structured.ainvoke = AsyncMock(return_value=mock_brief)
-            mock_llm.with_structured_output.return_value = mock_structured
-            mock_llm_class.return_value = mock_llm
+        mock_structured_llm.response = mock_brief
 
-            result = await brief_generate_node(state, {})
+        result = await brief_generate_node(state, {})
 
         assert "messages" in result
         assert len(result["messages"]) == 1
@@ -520,38 +528,22 @@ class TestBriefGenerateNode:
         assert result["mode"] == "chat"  # Returns to chat mode
         assert result["suggest_lawyer"] is True
 
-    @pytest.mark.asyncio
-    async def test_includes_quick_replies_after_brief(self):
+    async def test_includes_quick_replies_after_brief(self, mock_structured_llm):
         """Brief includes relevant quick replies."""
         state = _create_test_state(
             messages=[HumanMessage(content="Test")],
             brief_facts_collected={"legal_area": "general"},
         )
 
-        mock_brief = ConversationalBrief(
+        mock_structured_llm.response = _make_brief(
             executive_summary="Test brief",
             legal_area="general",
-            jurisdiction="NSW",
             situation_narrative="Test",
-            key_facts=[],
-            fact_gaps=[],
-            parties=[],
-            documents_evidence=[],
-            client_goals=[],
-            potential_issues=[],
-            questions_for_lawyer=[],
             urgency_level="low_priority",
             urgency_reason="No urgency",
         )
 
-        with patch("app.agents.stages.brief_flow.ChatOpenAI") as mock_llm_class:
-            mock_llm = MagicMock()
-            mock_structured = MagicMock()
-            mock_structured.ainvoke = AsyncMock(return_value=mock_brief)
-            mock_llm.with_structured_output.return_value = mock_structured
-            mock_llm_class.return_value = mock_llm
-
-            result = await brief_generate_node(state, {})
+        result = await brief_generate_node(state, {})
 
         assert "quick_replies" in result
         assert "Find me a lawyer" in result["quick_replies"]
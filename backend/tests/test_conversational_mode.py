@@ -3,7 +3,6 @@
 import pytest
 from langchain_core.messages import HumanMessage, AIMessage
 
-from app.agents.conversational_state import ConversationalState
 from app.agents.conversational_graph import (
     get_conversational_graph,
     route_after_initialize,
@@ -12,7 +11,31 @@ from app.agents.utils import extract_user_state, extract_legal_topic
 from app.agents.stages.safety_check_lite import (
     _check_crisis_keywords,
     _might_be_risky,
+    safety_check_lite_node,
+    format_escalation_response_lite,
 )
+from app.agents.stages.chat_response import _create_chat_agent
+from tests.conftest import create_test_state
+
+
+@pytest.fixture
+def llm_safety_check(monkeypatch):
+    """Patch the LLM safety check; set .assessment per test, inspect .calls."""
+
+    class _StubSafetyCheck:
+        def __init__(self):
+            self.assessment = {"requires_escalation": False}
+            self.calls = []
+
+        async def __call__(self, query, user_state, config):
+            self.calls.append(query)
+            return self.assessment
+
+    stub = _StubSafetyCheck()
+    monkeypatch.setattr(
+        "app.agents.stages.safety_check_lite._llm_safety_check", stub
+    )
+    return stub
 
 
 class TestCrisisKeywordDetection:
@@ -57,107 +80,76 @@ class TestRiskyKeywordDetection:
         assert _might_be_risky("What are tenant rights?") is False
 
 
+class TestSafetyCheckLiteNode:
+    """Test the safety check node's keyword and LLM paths."""
+
+    async def test_crisis_keywords_escalate_without_llm(self, llm_safety_check):
+        state = create_test_state(current_query="I want to kill myself", user_state="NSW")
+        result = await safety_check_lite_node(state, {})
+        assert result["safety_result"] == "escalate"
+        assert result["crisis_resources"]
+        assert llm_safety_check.calls == []
+
+    async def test_uncertain_keywords_use_llm(self, llm_safety_check):
+        llm_safety_check.assessment = {
+            "requires_escalation": True,
+            "recommended_resources": [{"name": "Legal Aid NSW"}],
+        }
+        state = create_test_state(current_query="I have court tomorrow")
+        result = await safety_check_lite_node(state, {})
+        assert llm_safety_check.calls == ["I have court tomorrow"]
+        assert result["safety_result"] == "escalate"
+        assert result["crisis_resources"] == [{"name": "Legal Aid NSW"}]
+
+    async def test_llm_can_clear_uncertain_query(self, llm_safety_check):
+        state = create_test_state(current_query="I have court tomorrow")
+        result = await safety_check_lite_node(state, {})
+        assert len(llm_safety_check.calls) == 1
+        assert result["safety_result"] == "safe"
+
+    async def test_normal_query_skips_llm(self, llm_safety_check):
+        state = create_test_state(current_query="What are tenant rights?")
+        result = await safety_check_lite_node(state, {})
+        assert result["safety_result"] == "safe"
+        assert llm_safety_check.calls == []
+
+
+class TestEscalationResponse:
+    """Test the crisis escalation message."""
+
+    def test_lists_each_resource(self):
+        state = create_test_state(crisis_resources=[
+            {
+                "name": "Legal Aid NSW",
+                "phone": "1300 888 529",
+                "url": "https://www.legalaid.nsw.gov.au",
+                "description": "Free legal advice",
+            },
+            {"name": "1800RESPECT", "phone": None, "url": None, "description": None},
+        ])
+        message = format_escalation_response_lite(state)["messages"][0].content
+        assert "**Legal Aid NSW** - 1300 888 529" in message
+        assert "https://www.legalaid.nsw.gov.au" in message
+        assert "**1800RESPECT**\n\n---" in message
+
+
 class TestRouteAfterInitialize:
     """Test the routing logic after initialization."""
 
     def test_first_message_always_checks(self):
-        state: ConversationalState = {
-            "is_first_message": True,
-            "current_query": "Hello",
-            "messages": [],
-            "session_id": "test",
-            "user_state": None,
-            "uploaded_document_url": None,
-            "mode": "chat",
-            "quick_replies": None,
-            "suggest_brief": False,
-            "suggest_lawyer": False,
-            "safety_result": "unknown",
-            "crisis_resources": None,
-            "brief_facts_collected": None,
-            "brief_missing_info": None,
-            "brief_unknown_info": None,
-            "brief_info_complete": False,
-            "brief_questions_asked": 0,
-            "brief_needs_full_intake": False,
-            "copilotkit": None,
-            "error": None,
-        }
+        state = create_test_state(is_first_message=True, current_query="Hello")
         assert route_after_initialize(state) == "check"
 
     def test_short_follow_up_skips(self):
-        state: ConversationalState = {
-            "is_first_message": False,
-            "current_query": "Tell me more",
-            "messages": [],
-            "session_id": "test",
-            "user_state": None,
-            "uploaded_document_url": None,
-            "mode": "chat",
-            "quick_replies": None,
-            "suggest_brief": False,
-            "suggest_lawyer": False,
-            "safety_result": "unknown",
-            "crisis_resources": None,
-            "brief_facts_collected": None,
-            "brief_missing_info": None,
-            "brief_unknown_info": None,
-            "brief_info_complete": False,
-            "brief_questions_asked": 0,
-            "brief_needs_full_intake": False,
-            "copilotkit": None,
-            "error": None,
-        }
+        state = create_test_state(current_query="Tell me more")
         assert route_after_initialize(state) == "skip"
 
     def test_emergency_keyword_checks(self):
-        state: ConversationalState = {
-            "is_first_message": False,
-            "current_query": "I need help now",
-            "messages": [],
-            "session_id": "test",
-            "user_state": None,
-            "uploaded_document_url": None,
-            "mode": "chat",
-            "quick_replies": None,
-            "suggest_brief": False,
-            "suggest_lawyer": False,
-            "safety_result": "unknown",
-            "crisis_resources": None,
-            "brief_facts_collected": None,
-            "brief_missing_info": None,
-            "brief_unknown_info": None,
-            "brief_info_complete": False,
-            "brief_questions_asked": 0,
-            "brief_needs_full_intake": False,
-            "copilotkit": None,
-            "error": None,
-        }
+        state = create_test_state(current_query="I need help now")
         assert route_after_initialize(state) == "check"
 
     def test_brief_mode_routes_to_brief(self):
-        state: ConversationalState = {
-            "is_first_message": False,
-            "current_query": "Generate brief",
-            "messages": [],
-            "session_id": "test",
-            "user_state": None,
-            "uploaded_document_url": None,
-            "mode": "brief",
-            "quick_replies": None,
-            "suggest_brief": False,
-            "suggest_lawyer": False,
-            "safety_result": "unknown",
-            "crisis_resources": None,
-            "brief_facts_collected": None,
-            "brief_missing_info": None,
-            "brief_unknown_info": None,
-            "brief_info_complete": False,
-            "brief_questions_asked": 0,
-            "brief_needs_full_intake": False,
-            "copilotkit": None,
-            "error": None,
-        }
+        state = create_test_state(current_query="Generate brief", mode="brief")
         assert route_after_initialize(state) == "brief"
 
 
@@ -165,61 +157,25 @@ class TestContextExtraction:
     """Test CopilotKit context extraction."""
 
     def test_extract_user_state_nsw(self):
-        state: ConversationalState = {
-            "copilotkit": {
+        state = create_test_state(
+            is_first_message=True,
+            copilotkit={
                 "context": [
                     {"description": "User's state/territory", "value": "NSW"}
                 ]
             },
-            "messages": [],
-            "session_id": "test",
-            "current_query": "",
-            "user_state": None,
-            "uploaded_document_url": None,
-            "mode": "chat",
-            "is_first_message": True,
-            "quick_replies": None,
-            "suggest_brief": False,
-            "suggest_lawyer": False,
-            "safety_result": "unknown",
-            "crisis_resources": None,
-            "brief_facts_collected": None,
-            "brief_missing_info": None,
-            "brief_unknown_info": None,
-            "brief_info_complete": False,
-            "brief_questions_asked": 0,
-            "brief_needs_full_intake": False,
-            "error": None,
-        }
+        )
         assert extract_user_state(state) == "NSW"
 
     def test_extract_user_state_with_quotes(self):
-        state: ConversationalState = {
-            "copilotkit": {
+        state = create_test_state(
+            is_first_message=True,
+            copilotkit={
                 "context": [
                     {"description": "User's state/territory", "value": '"VIC"'}
                 ]
             },
-            "messages": [],
-            "session_id": "test",
-            "current_query": "",
-            "user_state": None,
-            "uploaded_document_url": None,
-            "mode": "chat",
-            "is_first_message": True,
-            "quick_replies": None,
-            "suggest_brief": False,
-            "suggest_lawyer": False,
-            "safety_result": "unknown",
-            "crisis_resources": None,
-            "brief_facts_collected": None,
-            "brief_missing_info": None,
-            "brief_unknown_info": None,
-            "brief_info_complete": False,
-            "brief_questions_asked": 0,
-            "brief_needs_full_intake": False,
-            "error": None,
-        }
+        )
         assert extract_user_state(state) == "VIC"
 
 
@@ -261,6 +217,49 @@ class TestLegalTopicExtraction:
         assert extract_legal_topic(state) == "parking_ticket"
 
 
+@pytest.fixture
+def agent_builds(monkeypatch):
+    """Stub the LLM and ReAct builder; returns the prompts of built agents."""
+    prompts = []
+
+    def _stub_create_react_agent(llm, tools, prompt):
+        prompts.append(prompt)
+        return object()
+
+    monkeypatch.setattr(
+        "app.agents.stages.chat_response.ChatOpenAI", lambda **kwargs: object()
+    )
+    monkeypatch.setattr(
+        "app.agents.stages.chat_response.create_react_agent", _stub_create_react_agent
+    )
+    _create_chat_agent.cache_clear()
+    yield prompts
+    _create_chat_agent.cache_clear()
+
+
+class TestChatAgentCache:
+    """Test that compiled chat agents are reused per prompt context."""
+
+    def test_same_context_reuses_agent(self, agent_builds):
+        first = _create_chat_agent("NSW", True, "https://a.example/doc.pdf", "chat", "general")
+        second = _create_chat_agent("NSW", True, "https://a.example/doc.pdf", "chat", "general")
+        assert first is second
+        assert len(agent_builds) == 1
+
+    def test_different_document_builds_new_agent(self, agent_builds):
+        first = _create_chat_agent("NSW", True, "https://a.example/one.pdf")
+        second = _create_chat_agent("NSW", True, "https://a.example/two.pdf")
+        assert first is not second
+        assert "one.pdf" in agent_builds[0]
+        assert "two.pdf" in agent_builds[1]
+
+    def test_different_ui_mode_builds_new_agent(self, agent_builds):
+        first = _create_chat_agent("NSW", False, "", "chat")
+        second = _create_chat_agent("NSW", False, "", "analysis")
+        assert first is not second
+        assert len(agent_builds) == 2
+
+
 class TestConversationalGraphCompiles:
     """Test that the graph compiles correctly."""
 
@@ -268,15 +267,14 @@ class TestConversationalGraphCompiles:
         graph = get_conversational_graph()
         assert graph is not None
 
-    def test_graph_has_expected_nodes(self):
-        from app.agents.conversational_graph import build_conversational_graph
-        workflow = build_conversational_graph()
+    def test_graph_has_expected_nodes(self, conversational_workflow):
+        nodes = conversational_workflow.nodes
         # Check that the expected chat mode nodes exist
-        assert "initialize" in workflow.nodes
-        assert "safety_check" in workflow.nodes
-        assert "chat_response" in workflow.nodes
-        assert "escalation_response" in workflow.nodes
+        assert "initialize" in nodes
+        assert "safety_check" in nodes
+        assert "chat_response" in nodes
+        assert "escalation_response" in nodes
         # Check that brief mode nodes exist
-        assert "brief_check_info" in workflow.nodes
-        assert "brief_ask_questions" in workflow.nodes
-        assert "brief_generate" in workflow.nodes
+        assert "brief_check_info" in nodes
+        assert "brief_ask_questions" in nodes
+        assert "brief_generate" in nodes
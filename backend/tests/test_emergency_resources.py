@@ -0,0 +1,76 @@
+"""Tests for emergency and crisis resources."""
+
+import pytest
+
+from app.agents.schemas.emergency_resources import (
+    NATIONAL_RESOURCES,
+    STATE_RESOURCES,
+    get_resources_for_risk,
+)
+
+
+_REQUIRED_RESOURCE_FIELDS = frozenset({"name", "phone", "url", "description"})
+
+
+def _resource_params():
+    """One pytest param per resource entry, national and state-specific."""
+    tables = [("national", NATIONAL_RESOURCES)]
+    tables.extend(STATE_RESOURCES.items())
+    return [
+        pytest.param(resource, id=f"{scope}/{category}/{resource.get('name', index)}")
+        for scope, categories in tables
+        for category, resources in categories.items()
+        for index, resource in enumerate(resources)
+    ]
+
+
+_RESOURCES = _resource_params()
+
+
+class TestResourceData:
+    """Test the static resource tables."""
+
+    @pytest.mark.parametrize("resource", _RESOURCES)
+    def test_resources_have_required_fields(self, resource):
+        """Every resource carries the fields the escalation message renders."""
+        missing = _REQUIRED_RESOURCE_FIELDS - resource.keys()
+        assert not missing, f"missing {sorted(missing)}"
+
+    @pytest.mark.parametrize("resource", _RESOURCES)
+    def test_resources_have_contact_method(self, resource):
+        """Every resource can be reached by phone or website."""
+        assert resource["phone"] or resource["url"]
+
+
+class TestGetResourcesForRisk:
+    """Test resource lookup by risk category and state."""
+
+    def test_national_resources_without_state(self):
+        """Without a state only national resources are returned."""
+        resources = get_resources_for_risk("family_violence")
+        assert resources == NATIONAL_RESOURCES["family_violence"]
+
+    def test_includes_state_resources(self):
+        """State-specific resources follow the national ones."""
+        resources = get_resources_for_risk("family_violence", "NSW")
+        names = [r["name"] for r in resources]
+        assert names[0] == "1800RESPECT"
+        assert "NSW Domestic Violence Line" in names
+
+    def test_unknown_state_falls_back_to_national(self):
+        """An unknown state code returns national resources only."""
+        resources = get_resources_for_risk("criminal", "XX")
+        assert resources == NATIONAL_RESOURCES["criminal"]
+
+    def test_deduplicates_by_name(self):
+        """A resource listed nationally and for a state appears once."""
+        for state in STATE_RESOURCES:
+            for category in NATIONAL_RESOURCES:
+                names = [r["name"] for r in get_resources_for_risk(category, state)]
+                assert len(names) == len(set(names)), (state, category)
+
+    def test_returns_fresh_list_each_call(self):
+        """Cached lookups still hand each caller its own list."""
+        first = get_resources_for_risk("criminal", "NSW")
+        first.clear()
+        assert get_resources_for_risk("criminal", "NSW")
@@ -26,6 +26,15 @@ class TestLookupLaw:
         assert hasattr(lookup_law, "invoke")
         assert hasattr(lookup_law, "name")
 
+    async def test_running_loop_returns_error_message(self):
+        """Invoking the sync tool inside a running loop returns the error string."""
+        from app.tools.lookup_law import lookup_law
+
+        result = lookup_law.invoke({"query": "bond refund", "state": "NSW"})
+
+        assert isinstance(result, str)
+        assert result.startswith("Sorry, I couldn't search the legal database")
+
     def test_search_law_alias_exists(self):
         """Test that search_law alias function exists."""
         from app.tools.lookup_law import search_law
@@ -74,3 +83,29 @@ class TestEmbeddingService:
         service2 = get_embedding_service()
 
         assert service1 is service2
+
+
+class TestReranker:
+    """Test the Cohere reranker service."""
+
+    def test_reranker_singleton(self):
+        """Test that reranker uses singleton pattern."""
+        from app.services.reranker import get_reranker
+
+        reranker1 = get_reranker()
+        reranker2 = get_reranker()
+
+        assert reranker1 is reranker2
+
+
+class TestAustLIISearcher:
+    """Test the AustLII searcher service."""
+
+    def test_austlii_searcher_singleton(self):
+        """Test that AustLII searcher uses singleton pattern."""
+        from app.services.austlii_search import get_austlii_searcher
+
+        searcher1 = get_austlii_searcher()
+        searcher2 = get_austlii_searcher()
+
+        assert searcher1 is searcher2
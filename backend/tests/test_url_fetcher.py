@@ -4,63 +4,49 @@ import pytest
 from app.utils.url_fetcher import is_safe_url, ALLOWED_HOSTS
 
 
-class TestSSRFProtection:
-    """Test SSRF protection in URL validation."""
-
-    def test_blocks_localhost(self):
-        """Should block localhost URLs."""
-        assert is_safe_url("http://localhost/secret") is False
-        assert is_safe_url("http://localhost:8000/admin") is False
-        assert is_safe_url("https://localhost/api") is False
-
-    def test_blocks_loopback_ip(self):
-        """Should block 127.0.0.1 loopback."""
-        assert is_safe_url("http://127.0.0.1/") is False
-        assert is_safe_url("http://127.0.0.1:3000/api") is False
-
-    def test_blocks_private_ip_ranges(self):
-        """Should block private IP ranges (10.x, 172.16-31.x, 192.168.x)."""
-        # 10.0.0.0/8
-        assert is_safe_url("http://10.0.0.1/internal") is False
-        assert is_safe_url("http://10.255.255.255/") is False
-
-        # 172.16.0.0/12
-        assert is_safe_url("http://172.16.0.1/") is False
-        assert is_safe_url("http://172.31.255.255/") is False
-
-        # 192.168.0.0/16
-        assert is_safe_url("http://192.168.1.1/router") is False
-        assert is_safe_url("http://192.168.0.1/") is False
+# URLs that must be rejected regardless of allowlist configuration
+_BLOCKED_URLS = [
+    # localhost
+    pytest.param("http://localhost/secret", id="localhost"),
+    pytest.param("http://localhost:8000/admin", id="localhost-port-8000"),
+    pytest.param("https://localhost/api", id="localhost-https"),
+    pytest.param("http://localhost:3000/", id="localhost-port-3000"),
+    # 127.0.0.1 loopback
+    pytest.param("http://127.0.0.1/", id="loopback"),
+    pytest.param("http://127.0.0.1:3000/api", id="loopback-port-3000"),
+    pytest.param("http://127.0.0.1:8080/", id="loopback-port-8080"),
+    # 10.0.0.0/8
+    pytest.param("http://10.0.0.1/internal", id="private-10-low"),
+    pytest.param("http://10.255.255.255/", id="private-10-high"),
+    # 172.16.0.0/12
+    pytest.param("http://172.16.0.1/", id="private-172-low"),
+    pytest.param("http://172.31.255.255/", id="private-172-high"),
+    # 192.168.0.0/16
+    pytest.param("http://192.168.1.1/router", id="private-192-router"),
+    pytest.param("http://192.168.0.1/", id="private-192"),
+    # Cloud metadata, IPv6 localhost, unspecified address
+    pytest.param("http://169.254.169.254/latest/meta-data/", id="aws-metadata"),
+    pytest.param("http://[::1]/", id="ipv6-localhost"),
+    pytest.param("http://0.0.0.0/", id="zero-ip"),
+    # Non-HTTP(S) schemes
+    pytest.param("file:///etc/passwd", id="scheme-file"),
+    pytest.param("ftp://example.com/file", id="scheme-ftp"),
+    pytest.param("gopher://example.com/", id="scheme-gopher"),
+    # Malformed URLs
+    pytest.param("", id="malformed-empty"),
+    pytest.param("not-a-url", id="malformed-no-scheme"),
+    pytest.param("http://", id="malformed-no-host"),
+    pytest.param("://missing-scheme.com", id="malformed-empty-scheme"),
+]
 
-    def test_blocks_aws_metadata(self):
-        """Should block AWS metadata endpoint."""
-        assert is_safe_url("http://169.254.169.254/latest/meta-data/") is False
 
-    def test_blocks_ipv6_localhost(self):
-        """Should block IPv6 localhost."""
-        assert is_safe_url("http://[::1]/") is False
-
-    def test_blocks_non_http_schemes(self):
-        """Should block non-HTTP(S) schemes."""
-        assert is_safe_url("file:///etc/passwd") is False
-        assert is_safe_url("ftp://example.com/file") is False
-        assert is_safe_url("gopher://example.com/") is False
-
-    def test_blocks_zero_ip(self):
-        """Should block 0.0.0.0."""
-        assert is_safe_url("http://0.0.0.0/") is False
-
-    def test_handles_malformed_urls(self):
-        """Should safely handle malformed URLs."""
-        assert is_safe_url("") is False
-        assert is_safe_url("not-a-url") is False
-        assert is_safe_url("http://") is False
-        assert is_safe_url("://missing-scheme.com") is False
+class TestSSRFProtection:
+    """Test SSRF protection in URL validation."""
 
-    def test_blocks_localhost_with_ports(self):
-        """Should block localhost regardless of port."""
-        assert is_safe_url("http://localhost:3000/") is False
-        assert is_safe_url("http://127.0.0.1:8080/") is False
+    @pytest.mark.parametrize("url", _BLOCKED_URLS)
+    def test_blocks_unsafe_url(self, url):
+        """Should block internal, non-HTTP(S) and malformed URLs."""
+        assert is_safe_url(url) is False
 
 
 class TestAllowlistBehavior:
@@ -90,13 +76,10 @@ class TestAllowlistBehavior:
         if not ALLOWED_HOSTS:
             pytest.skip("ALLOWED_HOSTS not configured")
 
-        # Check if supabase.co is in allowlist
-        has_supabase = any("supabase.co" in h for h in ALLOWED_HOSTS)
-        if not has_supabase:
+        # Find the supabase domain in the allowlist (single pass)
+        supabase_host = next((h for h in ALLOWED_HOSTS if "supabase.co" in h), None)
+        if supabase_host is None:
             pytest.skip("Supabase not in allowlist")
 
-        # Find the exact supabase domain
-        supabase_host = next((h for h in ALLOWED_HOSTS if "supabase.co" in h), None)
-        if supabase_host:
-            test_url = f"https://{supabase_host}/storage/v1/object/public/documents/test.pdf"
-            assert is_safe_url(test_url) is True
+        test_url = f"https://{supabase_host}/storage/v1/object/public/documents/test.pdf"
+        assert is_safe_url(test_url) is True